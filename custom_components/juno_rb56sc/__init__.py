@@ -6,21 +6,61 @@ import logging
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.start import async_at_started
+
+from .const import (
+    DATA_MESH_COORDINATOR,
+    DATA_OTA_ROLLOUT,
+    DATA_SNAPSHOTS,
+    DOMAIN,
+    OTA_IMAGE_DIR,
+)
+from .mesh import JunoMeshCoordinator
+from .ota import JunoOtaRollout, OtaImageCache
+from .services import async_setup_services
+from .snapshot import JunoLightSnapshots
 
 CONFIG_SCHEMA = vol.Schema({}, extra=vol.ALLOW_EXTRA)
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.LIGHT, Platform.SENSOR]
+PLATFORMS = [Platform.LIGHT, Platform.SENSOR, Platform.UPDATE]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Juno RB56SC Zigbee Light component."""
     hass.data.setdefault(DOMAIN, {})
+
+    # The mesh scan and OTA rollout span every configured device, so they
+    # live at domain level
+    mesh_coordinator = JunoMeshCoordinator(hass)
+    hass.data[DOMAIN][DATA_MESH_COORDINATOR] = mesh_coordinator
+
+    image_cache = OtaImageCache(hass, hass.config.path(OTA_IMAGE_DIR))
+    rollout = JunoOtaRollout(hass, image_cache, mesh_coordinator)
+    await rollout.async_load()
+    hass.data[DOMAIN][DATA_OTA_ROLLOUT] = rollout
+
+    async def _async_started(hass: HomeAssistant) -> None:
+        """Scan the mesh and resume interrupted transfers once ZHA is up."""
+        rollout.async_resume()
+        await mesh_coordinator.async_refresh()
+
+    async_at_started(hass, _async_started)
+
+    async def _async_stop_rollout(event: Event) -> None:
+        """Cancel running transfers on shutdown so they resume next start."""
+        rollout.async_shutdown()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_rollout)
+
+    snapshots = JunoLightSnapshots(hass)
+    await snapshots.async_load()
+    hass.data[DOMAIN][DATA_SNAPSHOTS] = snapshots
+
+    async_setup_services(hass)
     return True
 
 
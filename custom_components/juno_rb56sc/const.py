@@ -8,7 +8,7 @@ MODEL = "RB56SC"
 CONF_DEVICE = "device"
 
 # Platforms
-PLATFORMS = ["light", "sensor"]
+PLATFORMS = ["light", "sensor", "update"]
 
 # Device attributes
 ATTR_FIRMWARE_VERSION = "firmware_version"
@@ -20,6 +20,59 @@ ATTR_MODEL = "model"
 CLUSTER_ON_OFF = 0x0006
 CLUSTER_LEVEL = 0x0008
 CLUSTER_BASIC = 0x0000
+CLUSTER_OTA = 0x0019
+
+# OTA cluster attributes
+ATTR_OTA_CURRENT_FILE_VERSION = 0x0002
+ATTR_OTA_IMAGE_TYPE_ID = 0x0008
 
 # Update interval
 SCAN_INTERVAL = 30  # seconds
+
+# hass.data keys shared by all config entries
+DATA_OTA_ROLLOUT = "ota_rollout"
+DATA_SNAPSHOTS = "snapshots"
+DATA_MESH_COORDINATOR = "mesh_coordinator"
+
+# Services
+SERVICE_UPDATE_FLEET = "update_fleet"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_MESH_REPORT = "mesh_report"
+
+# Service attributes
+ATTR_NAME = "name"
+ATTR_COUNT = "count"
+ATTR_SCAN = "scan"
+DEFAULT_SNAPSHOT_NAME = "default"
+
+# Dispatcher signals
+SIGNAL_OTA_UPDATED = f"{DOMAIN}_ota_updated"
+
+# OTA image cache
+OTA_IMAGE_DIR = "zigpy_ota"  # relative to the Home Assistant config directory
+OTA_IMAGE_CACHE_TTL = 3600  # seconds
+
+# OTA fleet rollout
+OTA_MAX_CONCURRENT_TRANSFERS = 2
+OTA_STAGGER_DELAY = 30  # seconds between transfer starts
+OTA_ROUTER_PACING_DELAY = 60  # seconds a router rests between transfers
+OTA_TRANSFER_TIMEOUT = 3600  # seconds
+OTA_MAX_ATTEMPTS = 3
+OTA_OFFER_TIMEOUT = 900  # seconds to wait for ZHA to offer an image to a device
+OTA_RETRY_DELAY = 120  # seconds
+OTA_DURATION_SAMPLES = 20  # measured transfers kept for the estimate
+OTA_ESTIMATED_THROUGHPUT = 1000  # bytes per second, used until transfers are measured
+OTA_STORAGE_KEY = f"{DOMAIN}.ota_rollout"
+OTA_STORAGE_VERSION = 1
+
+# Light state snapshots
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshots"
+SNAPSHOT_STORAGE_VERSION = 1
+
+# Mesh link health
+MESH_SCAN_INTERVAL = 900  # seconds between refreshes from zigpy's topology cache
+MESH_SCAN_CACHE_TTL = 14400  # seconds an on-demand scan overrides zigpy's cache
+MESH_SCAN_CONCURRENCY = 2  # neighbor tables read at the same time
+MESH_SCAN_TIMEOUT = 30  # seconds per neighbor table page
+MESH_REPORT_COUNT = 10
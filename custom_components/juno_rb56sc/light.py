@@ -11,10 +11,11 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_DEVICE, DOMAIN, MANUFACTURER, MODEL
+from .zigbee import async_get_zha_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +29,6 @@ async def async_setup_entry(
     device_id = config_entry.data[CONF_DEVICE]
     
     device_registry = dr.async_get(hass)
-    entity_registry = er.async_get(hass)
     
     device = device_registry.async_get(device_id)
     
@@ -37,13 +37,7 @@ async def async_setup_entry(
         return
 
     # Find existing ZHA light entity for this device
-    entities = er.async_entries_for_device(entity_registry, device_id)
-    light_entity_id = None
-    
-    for entity in entities:
-        if entity.domain == "light" and entity.platform == "zha":
-            light_entity_id = entity.entity_id
-            break
+    light_entity_id = async_get_zha_entity_id(hass, device_id, "light")
     
     if light_entity_id:
         _LOGGER.debug("Found ZHA light entity: %s", light_entity_id)
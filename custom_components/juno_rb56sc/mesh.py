@@ -0,0 +1,272 @@
+"""Mesh link health of Juno devices from cached neighbor table scans."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_DEVICE,
+    DATA_OTA_ROLLOUT,
+    DOMAIN,
+    MESH_SCAN_CACHE_TTL,
+    MESH_SCAN_CONCURRENCY,
+    MESH_SCAN_INTERVAL,
+    MESH_SCAN_TIMEOUT,
+)
+from .zigbee import (
+    ZHA_DOMAIN,
+    NeighborEntry,
+    async_get_topology_tables,
+    async_get_zigpy_application,
+    convert_neighbor,
+    get_device_ieee,
+    select_parent,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+COORDINATOR_NWK = 0x0000
+
+
+@dataclass(frozen=True)
+class MeshLink:
+    """Link health of one Juno device."""
+
+    ieee: str
+    lqi: int | None
+    rssi: int | None
+    last_seen: datetime | None
+    parent_ieee: str | None
+    # LQI is the coordinator's last-hop reading, not a neighbor table link
+    lqi_fallback: bool
+
+
+class JunoMeshCoordinator(DataUpdateCoordinator[dict[str, MeshLink]]):
+    """Derive link health per device from cached neighbor tables.
+
+    Periodic refreshes only read the neighbor tables zigpy's own topology scan
+    has cached, so they cause no radio traffic. An active scan runs on demand.
+    It asks only the configured Juno devices and the Zigbee coordinator for
+    their neighbor tables, a few at a time, and is skipped while firmware
+    transfers are running. The result is keyed by device registry ID.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the mesh coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} mesh",
+            update_interval=timedelta(seconds=MESH_SCAN_INTERVAL),
+        )
+        self._semaphore = asyncio.Semaphore(MESH_SCAN_CONCURRENCY)
+        self._scanned_tables: dict[str, list[NeighborEntry]] = {}
+        self._scan_aborted = False
+        self.last_scan: datetime | None = None
+        # Routers whose neighbor table could not be read completely last scan
+        self.incomplete_routers: list[str] = []
+        self.coordinator_ieee: str | None = None
+
+    @callback
+    def async_get_parent_ieee(self, ieee: str) -> str | None:
+        """Return the parent router of a device from the last scan."""
+        for link in (self.data or {}).values():
+            if link.ieee == ieee:
+                return link.parent_ieee
+        return None
+
+    @callback
+    def async_get_router_name(self, ieee: str | None) -> str | None:
+        """Return the display name of a router, falling back to its IEEE."""
+        if ieee is None:
+            return None
+        router = dr.async_get(self.hass).async_get_device(
+            identifiers={(ZHA_DOMAIN, ieee)}
+        )
+        return (router.name_by_user or router.name) if router else ieee
+
+    @callback
+    def _async_get_devices(self, application: Any) -> tuple[dict[str, Any], Any]:
+        """Return the zigpy devices of all configured entries and the coordinator."""
+        from zigpy.types import EUI64
+
+        device_registry = dr.async_get(self.hass)
+        devices: dict[str, Any] = {}
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            device = device_registry.async_get(entry.data[CONF_DEVICE])
+            ieee = get_device_ieee(device) if device else None
+            if ieee is None:
+                continue
+            try:
+                devices[device.id] = application.get_device(ieee=EUI64.convert(ieee))
+            except KeyError:
+                continue
+
+        try:
+            zigbee_coordinator = application.get_device(nwk=COORDINATOR_NWK)
+        except KeyError:
+            zigbee_coordinator = None
+        else:
+            self.coordinator_ieee = str(zigbee_coordinator.ieee)
+
+        return devices, zigbee_coordinator
+
+    @callback
+    def _async_transfers_active(self) -> bool:
+        """Return True while the OTA rollout is transferring firmware."""
+        rollout = self.hass.data.get(DOMAIN, {}).get(DATA_OTA_ROLLOUT)
+        return rollout is not None and rollout.has_active_transfers
+
+    async def async_scan(self) -> None:
+        """Actively read neighbor tables, then refresh the link health."""
+        if self._async_transfers_active():
+            raise HomeAssistantError(
+                "Mesh scan skipped while firmware transfers are running"
+            )
+
+        application = async_get_zigpy_application(self.hass)
+        if application is None:
+            raise HomeAssistantError("ZHA is not running")
+
+        devices, zigbee_coordinator = self._async_get_devices(application)
+        routers = list(devices.values())
+        if zigbee_coordinator is not None:
+            routers.append(zigbee_coordinator)
+
+        self._scan_aborted = False
+        tables = await asyncio.gather(
+            *(self._async_read_neighbors(router) for router in routers)
+        )
+        if self._scan_aborted:
+            # Tables cut short for a transfer say nothing about the links
+            raise HomeAssistantError(
+                "Mesh scan aborted because firmware transfers started"
+            )
+
+        self._scanned_tables = {
+            str(router.ieee): neighbors
+            for router, neighbors in zip(routers, tables)
+            if neighbors is not None
+        }
+        self.incomplete_routers = [
+            str(router.ieee)
+            for router, neighbors in zip(routers, tables)
+            if neighbors is None
+        ]
+        self.last_scan = dt_util.utcnow()
+        await self.async_refresh()
+
+    async def _async_update_data(self) -> dict[str, MeshLink]:
+        """Derive the link health of each device from cached neighbor tables."""
+        application = async_get_zigpy_application(self.hass)
+        if application is None:
+            raise UpdateFailed("ZHA is not running")
+
+        devices, _zigbee_coordinator = self._async_get_devices(application)
+
+        scan_age = dt_util.utcnow() - self.last_scan if self.last_scan else None
+        if scan_age is not None and scan_age > timedelta(seconds=MESH_SCAN_CACHE_TTL):
+            self._scanned_tables = {}
+            self.incomplete_routers = []
+        # Tables from an on-demand scan are fresher than zigpy's topology cache
+        neighbor_tables = async_get_topology_tables(self.hass)
+        neighbor_tables.update(self._scanned_tables)
+
+        links: dict[str, MeshLink] = {}
+        for device_id, zigpy_device in devices.items():
+            ieee = str(zigpy_device.ieee)
+            parent_ieee, lqi = select_parent(ieee, neighbor_tables)
+            lqi_fallback = parent_ieee is None
+            if lqi_fallback:
+                lqi = getattr(zigpy_device, "lqi", None)
+            last_seen = getattr(zigpy_device, "last_seen", None)
+            links[device_id] = MeshLink(
+                ieee=ieee,
+                lqi=lqi,
+                rssi=getattr(zigpy_device, "rssi", None),
+                last_seen=dt_util.utc_from_timestamp(last_seen) if last_seen else None,
+                parent_ieee=parent_ieee,
+                lqi_fallback=lqi_fallback,
+            )
+
+        return links
+
+    async def _async_read_neighbors(self, router: Any) -> list[NeighborEntry] | None:
+        """Read the full neighbor table of a router, one page at a time.
+
+        Returns None unless every page was read, so a partial table never
+        replaces zigpy's complete cached one.
+        """
+        from zigpy.exceptions import ZigbeeException
+        from zigpy.zdo.types import Status
+
+        neighbors: list[NeighborEntry] = []
+        start_index = 0
+        async with self._semaphore:
+            while True:
+                if self._async_transfers_active():
+                    # Yield the air to firmware transfers that started meanwhile
+                    _LOGGER.debug("Neighbor table scan of %s postponed", router.ieee)
+                    self._scan_aborted = True
+                    return None
+                try:
+                    async with asyncio.timeout(MESH_SCAN_TIMEOUT):
+                        status, response = await router.zdo.Mgmt_Lqi_req(start_index)
+                except (TimeoutError, ZigbeeException) as err:
+                    _LOGGER.debug(
+                        "Neighbor table scan of %s failed: %s", router.ieee, err
+                    )
+                    return None
+                if status != Status.SUCCESS:
+                    return None
+                neighbors.extend(
+                    convert_neighbor(neighbor)
+                    for neighbor in response.NeighborTableList
+                )
+                start_index += len(response.NeighborTableList)
+                if start_index >= response.Entries:
+                    return neighbors
+                if not response.NeighborTableList:
+                    # The router stopped returning entries before the end
+                    return None
+
+    @callback
+    def async_get_report(self, count: int) -> dict[str, Any]:
+        """Summarize the weakest links of the fleet from the cached tables."""
+        device_registry = dr.async_get(self.hass)
+
+        def _name(device_id: str | None) -> str | None:
+            device = device_registry.async_get(device_id) if device_id else None
+            return (device.name_by_user or device.name) if device else None
+
+        links = sorted(
+            (self.data or {}).items(),
+            key=lambda item: item[1].lqi if item[1].lqi is not None else -1,
+        )
+        return {
+            "scanned_at": self.last_scan.isoformat() if self.last_scan else None,
+            "devices": len(links),
+            "incomplete_tables": [
+                self.async_get_router_name(ieee) for ieee in self.incomplete_routers
+            ],
+            "worst_links": [
+                {
+                    "device": _name(device_id),
+                    "ieee": link.ieee,
+                    "lqi": link.lqi,
+                    "lqi_fallback": link.lqi_fallback,
+                    "rssi": link.rssi,
+                    "parent_router": self.async_get_router_name(link.parent_ieee),
+                }
+                for device_id, link in links[:count]
+            ],
+        }
@@ -0,0 +1,546 @@
+"""Local OTA image cache and fleet rollout scheduler for Juno devices."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from dataclasses import dataclass
+import logging
+import math
+import os
+import struct
+import time
+from typing import Any
+
+from homeassistant.components.update import ATTR_LATEST_VERSION
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_DEVICE,
+    DOMAIN,
+    OTA_DURATION_SAMPLES,
+    OTA_ESTIMATED_THROUGHPUT,
+    OTA_IMAGE_CACHE_TTL,
+    OTA_MAX_ATTEMPTS,
+    OTA_MAX_CONCURRENT_TRANSFERS,
+    OTA_OFFER_TIMEOUT,
+    OTA_RETRY_DELAY,
+    OTA_ROUTER_PACING_DELAY,
+    OTA_STAGGER_DELAY,
+    OTA_STORAGE_KEY,
+    OTA_STORAGE_VERSION,
+    OTA_TRANSFER_TIMEOUT,
+    SIGNAL_OTA_UPDATED,
+)
+from .mesh import JunoMeshCoordinator
+from .zigbee import (
+    async_get_parent_ieee,
+    async_get_zha_entity_id,
+    async_get_zigpy_device,
+    get_device_ieee,
+    get_ota_identity,
+    parse_file_version,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+OTA_MAGIC = 0x0BEEF11E
+# magic, header version, header length, field control, manufacturer code,
+# image type, file version, stack version, header string, image size
+OTA_HEADER = struct.Struct("<IHHHHHIH32sI")
+# Some vendors wrap the image in a container; the header follows shortly after
+OTA_HEADER_SEARCH_LIMIT = 4096
+
+
+@dataclass(frozen=True)
+class OtaImage:
+    """An OTA image file available in the local cache."""
+
+    manufacturer_code: int
+    image_type: int
+    file_version: int
+    image_size: int
+    header_string: str
+    path: str
+
+
+def parse_ota_header(path: str) -> OtaImage | None:
+    """Parse the Zigbee OTA header of an image file."""
+    try:
+        with open(path, "rb") as image_file:
+            data = image_file.read(OTA_HEADER_SEARCH_LIMIT + OTA_HEADER.size)
+    except OSError as err:
+        _LOGGER.debug("Unable to read OTA image %s: %s", path, err)
+        return None
+
+    offset = data.find(struct.pack("<I", OTA_MAGIC))
+    if offset < 0 or offset + OTA_HEADER.size > len(data):
+        return None
+
+    (
+        _magic,
+        _header_version,
+        _header_length,
+        _field_control,
+        manufacturer_code,
+        image_type,
+        file_version,
+        _stack_version,
+        header_string,
+        image_size,
+    ) = OTA_HEADER.unpack_from(data, offset)
+
+    return OtaImage(
+        manufacturer_code=manufacturer_code,
+        image_type=image_type,
+        file_version=file_version,
+        image_size=image_size,
+        header_string=header_string.split(b"\x00", 1)[0].decode(errors="replace"),
+        path=path,
+    )
+
+
+class OtaImageCache:
+    """Index of the newest local OTA image per manufacturer code and image type."""
+
+    def __init__(self, hass: HomeAssistant, directory: str) -> None:
+        """Initialize the image cache."""
+        self.hass = hass
+        self.directory = directory
+        self._images: dict[tuple[int, int], OtaImage] = {}
+        self._last_scan: float | None = None
+        self._scan_lock = asyncio.Lock()
+
+    async def async_refresh(self, force: bool = False) -> None:
+        """Rescan the image directory when the cached index has expired."""
+        async with self._scan_lock:
+            if (
+                not force
+                and self._last_scan is not None
+                and time.monotonic() - self._last_scan < OTA_IMAGE_CACHE_TTL
+            ):
+                return
+            self._images = await self.hass.async_add_executor_job(self._scan)
+            self._last_scan = time.monotonic()
+            _LOGGER.debug(
+                "Indexed %d OTA images from %s", len(self._images), self.directory
+            )
+
+    def _scan(self) -> dict[tuple[int, int], OtaImage]:
+        """Build the image index; runs in the executor."""
+        images: dict[tuple[int, int], OtaImage] = {}
+        if not os.path.isdir(self.directory):
+            return images
+
+        for root, _dirs, files in os.walk(self.directory):
+            for filename in files:
+                image = parse_ota_header(os.path.join(root, filename))
+                if image is None:
+                    continue
+                key = (image.manufacturer_code, image.image_type)
+                current = images.get(key)
+                if current is None or image.file_version > current.file_version:
+                    images[key] = image
+
+        return images
+
+    async def async_get_image(
+        self, manufacturer_code: int, image_type: int | None
+    ) -> OtaImage | None:
+        """Return the newest image for a manufacturer code and image type.
+
+        When the device has not reported its image type yet, an image is only
+        returned if the manufacturer publishes a single image type.
+        """
+        await self.async_refresh()
+
+        if image_type is not None:
+            return self._images.get((manufacturer_code, image_type))
+
+        candidates = [
+            image
+            for (code, _image_type), image in self._images.items()
+            if code == manufacturer_code
+        ]
+        return candidates[0] if len(candidates) == 1 else None
+
+
+class JunoOtaRollout:
+    """Schedule OTA transfers across all configured Juno devices.
+
+    Transfers are delegated to the ZHA update entity of each device. The
+    scheduler caps how many run at once, staggers their start, serializes
+    transfers behind the same router and persists the queue so an interrupted
+    rollout resumes after a restart.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cache: OtaImageCache,
+        mesh_coordinator: JunoMeshCoordinator,
+    ) -> None:
+        """Initialize the rollout scheduler."""
+        self.hass = hass
+        self.image_cache = image_cache
+        self.mesh_coordinator = mesh_coordinator
+        self._store: Store = Store(hass, OTA_STORAGE_VERSION, OTA_STORAGE_KEY)
+        self._semaphore = asyncio.Semaphore(OTA_MAX_CONCURRENT_TRANSFERS)
+        self._stagger_lock = asyncio.Lock()
+        self._router_locks: dict[str, asyncio.Lock] = {}
+        self._pending: list[str] = []
+        self._active: set[str] = set()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._last_start = 0.0
+        self._durations: deque[float] = deque(maxlen=OTA_DURATION_SAMPLES)
+        self._last_image_notify: float | None = None
+
+    async def async_load(self) -> None:
+        """Load rollout state left behind by a previous run."""
+        data = await self._store.async_load()
+        if data:
+            self._pending = list(data.get("pending", []))
+            if self._pending:
+                _LOGGER.info(
+                    "Found %d interrupted OTA transfers to resume", len(self._pending)
+                )
+
+    @callback
+    def async_resume(self) -> None:
+        """Restart transfers that were queued when Home Assistant stopped.
+
+        Each transfer checks that its device still needs the update before it
+        starts, so devices updated in the meantime drop out of the queue, and
+        waits for ZHA to offer the image again after the restart.
+        """
+        for device_id in self._pending:
+            self._async_schedule(device_id)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel running transfers; pending ones stay stored for resume."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    def is_queued(self, device_id: str) -> bool:
+        """Return True if a transfer for the device is waiting to start."""
+        return device_id in self._tasks and device_id not in self._active
+
+    @property
+    def has_active_transfers(self) -> bool:
+        """Return True while any transfer is running."""
+        return bool(self._active)
+
+    def is_transferring(self, device_id: str) -> bool:
+        """Return True if a transfer for the device is running."""
+        return device_id in self._active
+
+    async def async_get_available_image(
+        self, device: dr.DeviceEntry
+    ) -> tuple[int | None, OtaImage | None]:
+        """Return the installed file version and the newest cached image."""
+        installed_version = parse_file_version(device.sw_version)
+        zigpy_device = async_get_zigpy_device(self.hass, device)
+        if zigpy_device is None:
+            return installed_version, None
+
+        manufacturer_code, image_type, file_version = get_ota_identity(zigpy_device)
+        if file_version is not None:
+            installed_version = file_version
+        if manufacturer_code is None:
+            return installed_version, None
+
+        image = await self.image_cache.async_get_image(manufacturer_code, image_type)
+        return installed_version, image
+
+    async def async_update_fleet(
+        self, config_entries: list[ConfigEntry]
+    ) -> dict[str, Any]:
+        """Queue every configured device that has a newer cached image."""
+        await self.image_cache.async_refresh(force=True)
+        device_registry = dr.async_get(self.hass)
+
+        queued: list[str] = []
+        routers: Counter[str] = Counter()
+        waiting_for_offer: list[str] = []
+        total_bytes = 0
+        for entry in config_entries:
+            device = device_registry.async_get(entry.data[CONF_DEVICE])
+            if device is None or device.id in self._active:
+                continue
+            installed_version, image = await self.async_get_available_image(device)
+            if image is None or (
+                installed_version is not None
+                and image.file_version <= installed_version
+            ):
+                continue
+            update_entity_id = self._get_zha_update_entity(device.id)
+            if update_entity_id is None:
+                continue
+            if not self._zha_offers_update(update_entity_id):
+                waiting_for_offer.append(device.id)
+            queued.append(device.id)
+            routers[self._router_for(device)] += 1
+            total_bytes += image.image_size
+
+        for device_id in queued:
+            self._async_queue(device_id)
+        await self._async_save()
+
+        estimated_duration = self._estimate_duration(
+            len(queued),
+            max(routers.values(), default=0),
+            total_bytes,
+        )
+        _LOGGER.info(
+            "Queued %d Juno devices for OTA update, estimated duration %d minutes",
+            len(queued),
+            estimated_duration // 60,
+        )
+        if waiting_for_offer:
+            _LOGGER.info(
+                "%d queued devices start once ZHA offers them the cached image",
+                len(waiting_for_offer),
+            )
+        return {
+            "queued": queued,
+            "waiting_for_offer": waiting_for_offer,
+            "estimated_duration": estimated_duration,
+        }
+
+    async def async_install(self, device_id: str) -> None:
+        """Queue a single device and wait until its transfer finishes."""
+        self._async_queue(device_id)
+        # The task may finish and drop out of _tasks while the queue is saved
+        task = self._tasks[device_id]
+        await self._async_save()
+        if not await asyncio.shield(task):
+            if device_id in self._pending:
+                raise HomeAssistantError(
+                    f"ZHA has not offered an update to device {device_id} yet; "
+                    "it stays queued"
+                )
+            raise HomeAssistantError(f"Firmware update of device {device_id} failed")
+
+    def _estimate_duration(
+        self, count: int, longest_chain: int, total_bytes: int
+    ) -> int:
+        """Estimate the wall-clock time of a rollout in seconds.
+
+        The rollout is bound either by the fleet-wide transfer slots or by the
+        router with the most devices behind it, whose transfers run one after
+        another with a pacing delay in between.
+        """
+        if count == 0:
+            return 0
+        if self._durations:
+            per_transfer = sum(self._durations) / len(self._durations)
+        else:
+            per_transfer = total_bytes / count / OTA_ESTIMATED_THROUGHPUT
+        waves = math.ceil(count / OTA_MAX_CONCURRENT_TRANSFERS)
+        slot_bound = waves * per_transfer + count * OTA_STAGGER_DELAY
+        router_bound = longest_chain * (per_transfer + OTA_ROUTER_PACING_DELAY)
+        return int(max(slot_bound, router_bound))
+
+    @callback
+    def _async_queue(self, device_id: str) -> None:
+        """Add a device to the pending queue and schedule its transfer."""
+        if device_id not in self._pending:
+            self._pending.append(device_id)
+        self._async_schedule(device_id)
+
+    @callback
+    def _async_schedule(self, device_id: str) -> None:
+        """Start the transfer task for a device unless one is already running."""
+        if device_id in self._tasks:
+            return
+        self._tasks[device_id] = self.hass.async_create_background_task(
+            self._async_run(device_id), f"{DOMAIN} OTA transfer {device_id}"
+        )
+        async_dispatcher_send(self.hass, SIGNAL_OTA_UPDATED, device_id)
+
+    async def _async_save(self) -> None:
+        """Persist the pending queue."""
+        await self._store.async_save({"pending": self._pending})
+
+    def _router_for(self, device: dr.DeviceEntry) -> str:
+        """Return the router a device's transfer is routed through."""
+        ieee = get_device_ieee(device)
+        if ieee is None:
+            return device.id
+        parent_ieee = self.mesh_coordinator.async_get_parent_ieee(
+            ieee
+        ) or async_get_parent_ieee(self.hass, ieee)
+        if parent_ieee is None or parent_ieee == self.mesh_coordinator.coordinator_ieee:
+            # Every transfer passes the Zigbee coordinator; only pace real routers
+            return ieee
+        return parent_ieee
+
+    async def _async_run(self, device_id: str) -> bool:
+        """Run a device transfer, retrying interrupted attempts.
+
+        Before every attempt the device is checked again, so resumed or retried
+        transfers stop once the device is up to date. A device ZHA does not
+        offer the image to yet stays queued rather than failing.
+        """
+        keep_pending = False
+        try:
+            for attempt in range(1, OTA_MAX_ATTEMPTS + 1):
+                device = dr.async_get(self.hass).async_get(device_id)
+                if device is None:
+                    _LOGGER.warning("Device %s is no longer registered", device_id)
+                    return False
+                if not await self._async_needs_update(device):
+                    _LOGGER.debug("Device %s is already up to date", device_id)
+                    return True
+                update_entity_id = self._get_zha_update_entity(device_id)
+                if update_entity_id is None:
+                    _LOGGER.warning("No ZHA update entity for device %s", device_id)
+                    return False
+                if not await self._async_wait_for_offer(update_entity_id):
+                    _LOGGER.info(
+                        "ZHA has not offered an update to device %s yet; it stays "
+                        "queued for the next rollout",
+                        device_id,
+                    )
+                    keep_pending = True
+                    return False
+                try:
+                    await self._async_transfer(device, update_entity_id)
+                except (HomeAssistantError, TimeoutError) as err:
+                    _LOGGER.warning(
+                        "OTA transfer to device %s failed (attempt %d of %d): %s",
+                        device_id,
+                        attempt,
+                        OTA_MAX_ATTEMPTS,
+                        err,
+                    )
+                    if attempt < OTA_MAX_ATTEMPTS:
+                        await asyncio.sleep(OTA_RETRY_DELAY)
+                    continue
+                return True
+            return False
+        finally:
+            # Cancelled transfers stay queued so they resume after a restart
+            if not keep_pending and not asyncio.current_task().cancelling():
+                self._pending.remove(device_id)
+                await self._async_save()
+            self._tasks.pop(device_id, None)
+            async_dispatcher_send(self.hass, SIGNAL_OTA_UPDATED, device_id)
+
+    async def _async_transfer(
+        self, device: dr.DeviceEntry, update_entity_id: str
+    ) -> None:
+        """Transfer firmware to one device within the rollout limits."""
+        device_id = device.id
+        router_lock = self._router_locks.setdefault(
+            self._router_for(device), asyncio.Lock()
+        )
+        await router_lock.acquire()
+        try:
+            async with self._semaphore:
+                async with self._stagger_lock:
+                    wait = self._last_start + OTA_STAGGER_DELAY - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self._last_start = time.monotonic()
+
+                self._active.add(device_id)
+                async_dispatcher_send(self.hass, SIGNAL_OTA_UPDATED, device_id)
+                started = time.monotonic()
+                try:
+                    async with asyncio.timeout(OTA_TRANSFER_TIMEOUT):
+                        await self.hass.services.async_call(
+                            "update",
+                            "install",
+                            {"entity_id": update_entity_id},
+                            blocking=True,
+                        )
+                finally:
+                    self._active.discard(device_id)
+                    async_dispatcher_send(self.hass, SIGNAL_OTA_UPDATED, device_id)
+                self._durations.append(time.monotonic() - started)
+        finally:
+            # Let the router drain before the next transfer behind it starts.
+            # Only the router lock waits out the delay; the device itself is
+            # finished and leaves the queue right away.
+            self.hass.loop.call_later(OTA_ROUTER_PACING_DELAY, router_lock.release)
+
+    async def _async_needs_update(self, device: dr.DeviceEntry) -> bool:
+        """Return True if the image cache has newer firmware for the device."""
+        installed_version, image = await self.async_get_available_image(device)
+        return image is not None and (
+            installed_version is None or image.file_version > installed_version
+        )
+
+    @callback
+    def _zha_offers_update(self, update_entity_id: str) -> bool:
+        """Return True if the ZHA update entity currently offers an image."""
+        state = self.hass.states.get(update_entity_id)
+        return (
+            state is not None
+            and state.state == STATE_ON
+            and state.attributes.get(ATTR_LATEST_VERSION) is not None
+        )
+
+    async def _async_wait_for_offer(self, update_entity_id: str) -> bool:
+        """Wait until ZHA offers an image to the device, up to a deadline.
+
+        ZHA only learns about an image once the device has sent it a Query Next
+        Image request; installing before that fails with "No update available".
+        """
+        offered = asyncio.Event()
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            if self._zha_offers_update(update_entity_id):
+                offered.set()
+
+        unsub = async_track_state_change_event(
+            self.hass, [update_entity_id], _async_state_changed
+        )
+        try:
+            if self._zha_offers_update(update_entity_id):
+                return True
+            self._async_request_image_notify(update_entity_id)
+            try:
+                async with asyncio.timeout(OTA_OFFER_TIMEOUT):
+                    await offered.wait()
+            except TimeoutError:
+                return False
+            return True
+        finally:
+            unsub()
+
+    @callback
+    def _async_request_image_notify(self, update_entity_id: str) -> None:
+        """Ask ZHA to tell devices about new images, once per rollout window.
+
+        Refreshing any ZHA update entity makes ZHA broadcast an Image Notify,
+        which prompts every device to query for a new image.
+        """
+        now = time.monotonic()
+        if (
+            self._last_image_notify is not None
+            and now - self._last_image_notify < OTA_OFFER_TIMEOUT
+        ):
+            return
+        self._last_image_notify = now
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                "homeassistant",
+                "update_entity",
+                {"entity_id": update_entity_id},
+            )
+        )
+
+    def _get_zha_update_entity(self, device_id: str) -> str | None:
+        """Return the ZHA firmware update entity of a device."""
+        return async_get_zha_entity_id(self.hass, device_id, "update")
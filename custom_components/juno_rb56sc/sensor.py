@@ -3,21 +3,31 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_FIRMWARE_VERSION,
     ATTR_MANUFACTURER,
     ATTR_MODEL,
     CONF_DEVICE,
+    DATA_MESH_COORDINATOR,
     DOMAIN,
     MANUFACTURER,
     MODEL,
 )
+from .mesh import JunoMeshCoordinator, MeshLink
+from .zigbee import async_get_zigpy_device
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +52,16 @@ async def async_setup_entry(
         JunoManufacturerSensor(device, config_entry),
         JunoModelSensor(device, config_entry),
     ]
+
+    coordinator: JunoMeshCoordinator = hass.data[DOMAIN][DATA_MESH_COORDINATOR]
+    sensors.extend(
+        [
+            JunoLinkQualitySensor(coordinator, device, config_entry),
+            JunoRssiSensor(device, config_entry),
+            JunoLastSeenSensor(device, config_entry),
+            JunoParentRouterSensor(coordinator, device, config_entry),
+        ]
+    )
     
     async_add_entities(sensors)
 
@@ -138,3 +158,137 @@ class JunoModelSensor(JunoBaseSensor):
         device = device_registry.async_get(self._device.id)
         if device:
             self._attr_native_value = device.model or MODEL
+
+
+class JunoMeshSensor(CoordinatorEntity[JunoMeshCoordinator], JunoBaseSensor):
+    """Base class for Juno RB56SC link health sensors fed by the mesh scan."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: JunoMeshCoordinator,
+        device: dr.DeviceEntry,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the link health sensor."""
+        CoordinatorEntity.__init__(self, coordinator)
+        JunoBaseSensor.__init__(self, device, config_entry)
+
+    @property
+    def _link(self) -> MeshLink | None:
+        """Return the link health of this device from the last scan."""
+        return (self.coordinator.data or {}).get(self._device.id)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last scan covered this device."""
+        return super().available and self._link is not None
+
+
+class JunoLinkQualitySensor(JunoMeshSensor):
+    """Sensor for the link quality between a Juno device and its parent router."""
+
+    _attr_name = "Link Quality"
+    _attr_icon = "mdi:signal"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: JunoMeshCoordinator,
+        device: dr.DeviceEntry,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the link quality sensor."""
+        super().__init__(coordinator, device, config_entry)
+        self._attr_unique_id = f"{device.id}_lqi"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the LQI of the device's route."""
+        return self._link.lqi if self._link else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, bool | None]:
+        """Return whether the LQI is the coordinator's last-hop reading."""
+        return {"lqi_fallback": self._link.lqi_fallback if self._link else None}
+
+
+class JunoRssiSensor(JunoBaseSensor):
+    """Sensor for the RSSI of the last frame received from a Juno device."""
+
+    _attr_name = "RSSI"
+    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
+    _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        device: dr.DeviceEntry,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the RSSI sensor."""
+        super().__init__(device, config_entry)
+        self._attr_unique_id = f"{device.id}_rssi"
+
+    async def async_update(self) -> None:
+        """Update the sensor."""
+        # Read from zigpy's in-memory device; this causes no radio traffic
+        zigpy_device = async_get_zigpy_device(self.hass, self._device)
+        self._attr_native_value = getattr(zigpy_device, "rssi", None)
+
+
+class JunoLastSeenSensor(JunoBaseSensor):
+    """Sensor for when a Juno device was last heard from."""
+
+    _attr_name = "Last Seen"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        device: dr.DeviceEntry,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the last seen sensor."""
+        super().__init__(device, config_entry)
+        self._attr_unique_id = f"{device.id}_last_seen"
+
+    async def async_update(self) -> None:
+        """Update the sensor."""
+        # Read from zigpy's in-memory device; this causes no radio traffic
+        zigpy_device = async_get_zigpy_device(self.hass, self._device)
+        last_seen = getattr(zigpy_device, "last_seen", None)
+        self._attr_native_value = (
+            dt_util.utc_from_timestamp(last_seen) if last_seen else None
+        )
+
+
+class JunoParentRouterSensor(JunoMeshSensor):
+    """Sensor for the router carrying a Juno device's route."""
+
+    _attr_name = "Parent Router"
+    _attr_icon = "mdi:router-wireless"
+
+    def __init__(
+        self,
+        coordinator: JunoMeshCoordinator,
+        device: dr.DeviceEntry,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the parent router sensor."""
+        super().__init__(coordinator, device, config_entry)
+        self._attr_unique_id = f"{device.id}_parent_router"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the name of the parent router."""
+        if self._link is None:
+            return None
+        return self.coordinator.async_get_router_name(self._link.parent_ieee)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str | None]:
+        """Return the IEEE address of the parent router."""
+        return {"ieee": self._link.parent_ieee if self._link else None}
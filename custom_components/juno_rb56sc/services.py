@@ -0,0 +1,106 @@
+"""Services for the Juno RB56SC Zigbee Light integration."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_COUNT,
+    ATTR_NAME,
+    ATTR_SCAN,
+    DATA_MESH_COORDINATOR,
+    DATA_OTA_ROLLOUT,
+    DATA_SNAPSHOTS,
+    DEFAULT_SNAPSHOT_NAME,
+    DOMAIN,
+    MESH_REPORT_COUNT,
+    SERVICE_MESH_REPORT,
+    SERVICE_RESTORE,
+    SERVICE_SNAPSHOT,
+    SERVICE_UPDATE_FLEET,
+)
+from .mesh import JunoMeshCoordinator
+from .ota import JunoOtaRollout
+from .snapshot import JunoLightSnapshots
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_NAME, default=DEFAULT_SNAPSHOT_NAME): cv.string}
+)
+
+MESH_REPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_COUNT, default=MESH_REPORT_COUNT): cv.positive_int,
+        vol.Optional(ATTR_SCAN, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Juno RB56SC services."""
+
+    async def async_update_fleet(call: ServiceCall) -> ServiceResponse:
+        """Queue a firmware update for every Juno device with a newer image."""
+        rollout: JunoOtaRollout = hass.data[DOMAIN][DATA_OTA_ROLLOUT]
+        return await rollout.async_update_fleet(
+            hass.config_entries.async_entries(DOMAIN)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPDATE_FLEET,
+        async_update_fleet,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Capture the state of every Juno light."""
+        snapshots: JunoLightSnapshots = hass.data[DOMAIN][DATA_SNAPSHOTS]
+        return await snapshots.async_snapshot(call.data[ATTR_NAME])
+
+    async def async_restore(call: ServiceCall) -> ServiceResponse:
+        """Restore the state of every Juno light from a snapshot."""
+        snapshots: JunoLightSnapshots = hass.data[DOMAIN][DATA_SNAPSHOTS]
+        return await snapshots.async_restore(call.data[ATTR_NAME])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        async_snapshot,
+        schema=SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        async_restore,
+        schema=SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_mesh_report(call: ServiceCall) -> ServiceResponse:
+        """Report the weakest Juno links, optionally after an active scan."""
+        coordinator: JunoMeshCoordinator = hass.data[DOMAIN][DATA_MESH_COORDINATOR]
+        if call.data[ATTR_SCAN]:
+            await coordinator.async_scan()
+        return coordinator.async_get_report(call.data[ATTR_COUNT])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MESH_REPORT,
+        async_mesh_report,
+        schema=MESH_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,146 @@
+"""Fleet-wide light state snapshots for Juno devices."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+import logging
+from typing import Any
+
+from homeassistant.components.light import ATTR_BRIGHTNESS
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_STORAGE_KEY, SNAPSHOT_STORAGE_VERSION
+from .zigbee import async_get_zha_entity_id
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stored brightness of a light that was off
+STATE_OFF_BRIGHTNESS = 0
+# Brightness steps a light may be off by and still count as restored
+BRIGHTNESS_TOLERANCE = 1
+
+
+class JunoLightSnapshots:
+    """Capture and replay the on/off and brightness state of all Juno lights.
+
+    A snapshot maps each light entity to a single brightness value, with 0
+    meaning off. Restoring groups lights sharing the same target so each group
+    is replayed with one service call.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot store."""
+        self.hass = hass
+        self._store: Store = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY
+        )
+        self._snapshots: dict[str, dict[str, int]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored snapshots."""
+        data = await self._store.async_load()
+        if data:
+            self._snapshots = data.get("snapshots", {})
+
+    def _get_zha_lights(self) -> dict[str, str]:
+        """Map each Juno light entity to the ZHA light entity it wraps.
+
+        The Juno light only syncs from ZHA periodically, so state is read from
+        the ZHA entity to see changes made through ZHA, scenes or wall controls.
+        """
+        entity_registry = er.async_get(self.hass)
+        zha_lights: dict[str, str] = {}
+        for entity in entity_registry.entities.values():
+            if entity.platform != DOMAIN or entity.domain != "light":
+                continue
+            # Same lookup the Juno light uses to pick the entity it controls
+            zha_entity_id = async_get_zha_entity_id(
+                self.hass, entity.device_id, "light"
+            )
+            if zha_entity_id is not None:
+                zha_lights[entity.entity_id] = zha_entity_id
+        return zha_lights
+
+    def _get_brightness(self, entity_id: str) -> int | None:
+        """Return the current brightness of a light, 0 if off, None if unknown."""
+        state = self.hass.states.get(entity_id)
+        if state is None or state.state not in ("on", "off"):
+            return None
+        if state.state == "off":
+            return STATE_OFF_BRIGHTNESS
+        return state.attributes.get(ATTR_BRIGHTNESS) or 255
+
+    @staticmethod
+    def _in_target_state(current: int | None, target: int) -> bool:
+        """Return True if a light is already at its target brightness.
+
+        Lights may report one step off after a transition, e.g. 254 for 255.
+        """
+        if current is None:
+            return False
+        if STATE_OFF_BRIGHTNESS in (current, target):
+            return current == target
+        return abs(current - target) <= BRIGHTNESS_TOLERANCE
+
+    async def async_snapshot(self, name: str) -> dict[str, Any]:
+        """Capture the state of every Juno light under a snapshot name."""
+        snapshot: dict[str, int] = {}
+        for entity_id, zha_entity_id in self._get_zha_lights().items():
+            brightness = self._get_brightness(zha_entity_id)
+            if brightness is not None:
+                snapshot[entity_id] = brightness
+
+        self._snapshots[name] = snapshot
+        await self._store.async_save({"snapshots": self._snapshots})
+        _LOGGER.debug("Captured snapshot %s of %d lights", name, len(snapshot))
+        return {"lights": len(snapshot)}
+
+    async def async_restore(self, name: str) -> dict[str, Any]:
+        """Replay a snapshot, one concurrent service call per target state."""
+        if name not in self._snapshots:
+            raise HomeAssistantError(f"No snapshot named {name}")
+
+        zha_entity_ids = self._get_zha_lights()
+        groups: dict[int, list[str]] = defaultdict(list)
+        skipped = 0
+        for entity_id, brightness in self._snapshots[name].items():
+            zha_entity_id = zha_entity_ids.get(entity_id)
+            if zha_entity_id is None or self.hass.states.get(entity_id) is None:
+                # Light was removed since the snapshot was taken
+                continue
+            if self._in_target_state(self._get_brightness(zha_entity_id), brightness):
+                skipped += 1
+                continue
+            groups[brightness].append(entity_id)
+
+        calls = []
+        for brightness, entity_ids in groups.items():
+            if brightness == STATE_OFF_BRIGHTNESS:
+                calls.append(
+                    self.hass.services.async_call(
+                        "light", "turn_off", {"entity_id": entity_ids}, blocking=True
+                    )
+                )
+            else:
+                calls.append(
+                    self.hass.services.async_call(
+                        "light",
+                        "turn_on",
+                        {"entity_id": entity_ids, ATTR_BRIGHTNESS: brightness},
+                        blocking=True,
+                    )
+                )
+        await asyncio.gather(*calls)
+
+        restored = sum(len(entity_ids) for entity_ids in groups.values())
+        _LOGGER.debug(
+            "Restored snapshot %s: %d lights in %d groups, %d already in state",
+            name,
+            restored,
+            len(groups),
+            skipped,
+        )
+        return {"restored": restored, "groups": len(groups), "skipped": skipped}
@@ -0,0 +1,139 @@
+"""Update platform for Juno RB56SC Zigbee Light integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.update import (
+    UpdateDeviceClass,
+    UpdateEntity,
+    UpdateEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_DEVICE,
+    DATA_OTA_ROLLOUT,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    SIGNAL_OTA_UPDATED,
+)
+from .ota import JunoOtaRollout
+from .zigbee import format_file_version
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Juno RB56SC firmware update entity from a config entry."""
+    device_id = config_entry.data[CONF_DEVICE]
+
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get(device_id)
+
+    if not device:
+        _LOGGER.error("Device %s not found in registry", device_id)
+        return
+
+    rollout: JunoOtaRollout = hass.data[DOMAIN][DATA_OTA_ROLLOUT]
+    async_add_entities([JunoFirmwareUpdate(device, rollout, config_entry)], True)
+
+
+class JunoFirmwareUpdate(UpdateEntity):
+    """Firmware update for a Juno RB56SC device, installed via the fleet rollout."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Firmware"
+    _attr_device_class = UpdateDeviceClass.FIRMWARE
+    _attr_supported_features = (
+        UpdateEntityFeature.INSTALL | UpdateEntityFeature.PROGRESS
+    )
+
+    def __init__(
+        self,
+        device: dr.DeviceEntry,
+        rollout: JunoOtaRollout,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the firmware update entity."""
+        self._device = device
+        self._rollout = rollout
+        self._attr_unique_id = f"{device.id}_firmware_update"
+        self._attr_device_info = {
+            "identifiers": device.identifiers,
+            "name": device.name,
+            "manufacturer": device.manufacturer or MANUFACTURER,
+            "model": device.model or MODEL,
+            "sw_version": device.sw_version,
+        }
+        self._attr_installed_version = device.sw_version
+        self._attr_latest_version = device.sw_version
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_OTA_UPDATED, self._async_rollout_updated
+            )
+        )
+
+    @callback
+    def _async_rollout_updated(self, device_id: str) -> None:
+        """Refresh progress when the rollout state of this device changes."""
+        if device_id == self._device.id:
+            self.async_schedule_update_ha_state(True)
+
+    @property
+    def in_progress(self) -> bool:
+        """Return True while the device is queued or transferring."""
+        device_id = self._device.id
+        return self._rollout.is_queued(device_id) or self._rollout.is_transferring(
+            device_id
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the rollout state of the device."""
+        if self._rollout.is_transferring(self._device.id):
+            rollout_state = "transferring"
+        elif self._rollout.is_queued(self._device.id):
+            rollout_state = "queued"
+        else:
+            rollout_state = "idle"
+        return {"rollout_state": rollout_state}
+
+    async def async_install(
+        self, version: str | None, backup: bool, **kwargs: Any
+    ) -> None:
+        """Install the newest cached image through the fleet rollout."""
+        await self._rollout.async_install(self._device.id)
+
+    async def async_update(self) -> None:
+        """Update installed and latest versions from ZHA and the image cache."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get(self._device.id)
+        if device:
+            self._device = device
+
+        installed_version, image = await self._rollout.async_get_available_image(
+            self._device
+        )
+        self._attr_installed_version = (
+            format_file_version(installed_version) or self._device.sw_version
+        )
+        if image is not None and (
+            installed_version is None or image.file_version > installed_version
+        ):
+            self._attr_latest_version = format_file_version(image.file_version)
+        else:
+            self._attr_latest_version = self._attr_installed_version
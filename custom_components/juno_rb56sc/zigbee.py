@@ -0,0 +1,191 @@
+"""Helpers for reaching the zigpy device behind a ZHA device entry."""
+from __future__ import annotations
+
+import logging
+from typing import Any, NamedTuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import ATTR_OTA_CURRENT_FILE_VERSION, ATTR_OTA_IMAGE_TYPE_ID, CLUSTER_OTA
+
+_LOGGER = logging.getLogger(__name__)
+
+ZHA_DOMAIN = "zha"
+
+
+@callback
+def async_get_zigpy_application(hass: HomeAssistant) -> Any | None:
+    """Return the zigpy application controller used by ZHA, if it is running."""
+    try:
+        # Home Assistant 2024.7 and later
+        from homeassistant.components.zha.helpers import get_zha_gateway
+    except ImportError:
+        try:
+            from homeassistant.components.zha.core.helpers import get_zha_gateway
+        except ImportError:
+            return None
+
+    try:
+        gateway = get_zha_gateway(hass)
+    except (KeyError, ValueError):
+        return None
+
+    return getattr(gateway, "application_controller", None)
+
+
+@callback
+def async_get_zigpy_device(hass: HomeAssistant, device: dr.DeviceEntry) -> Any | None:
+    """Return the zigpy device for a ZHA device registry entry."""
+    ieee = get_device_ieee(device)
+    if ieee is None:
+        return None
+
+    application = async_get_zigpy_application(hass)
+    if application is None:
+        return None
+
+    from zigpy.types import EUI64
+
+    try:
+        return application.get_device(ieee=EUI64.convert(ieee))
+    except KeyError:
+        _LOGGER.debug("Device %s not known to the Zigbee network", ieee)
+        return None
+
+
+class NeighborEntry(NamedTuple):
+    """One entry of a router's neighbor table."""
+
+    ieee: str
+    lqi: int
+    is_parent: bool
+    is_child: bool
+    is_router: bool
+
+
+def convert_neighbor(neighbor: Any) -> NeighborEntry:
+    """Convert a zigpy neighbor table entry."""
+    from zigpy.zdo.types import Neighbor
+
+    return NeighborEntry(
+        ieee=str(neighbor.ieee),
+        lqi=neighbor.lqi,
+        is_parent=neighbor.relationship == Neighbor.Relationship.Parent,
+        is_child=neighbor.relationship == Neighbor.Relationship.Child,
+        is_router=neighbor.device_type
+        in (Neighbor.DeviceType.Coordinator, Neighbor.DeviceType.Router),
+    )
+
+
+@callback
+def async_get_topology_tables(hass: HomeAssistant) -> dict[str, list[NeighborEntry]]:
+    """Return the neighbor tables cached by zigpy's periodic topology scan."""
+    application = async_get_zigpy_application(hass)
+    topology = getattr(application, "topology", None)
+    if topology is None:
+        return {}
+
+    return {
+        str(router_ieee): [convert_neighbor(neighbor) for neighbor in neighbors]
+        for router_ieee, neighbors in topology.neighbors.items()
+    }
+
+
+def select_parent(
+    ieee: str, tables: dict[str, list[NeighborEntry]]
+) -> tuple[str | None, int | None]:
+    """Return the router carrying a device's route and the LQI of that link.
+
+    Juno lights are routers, which are never listed as anyone's child, so the
+    parent is the router that lists the device as its child (or that the
+    device lists as its parent) when there is one, otherwise the router with
+    the strongest link in either direction.
+    """
+    # (router, lqi, is parent relationship)
+    candidates: list[tuple[str, int, bool]] = []
+    for router_ieee, neighbors in tables.items():
+        if router_ieee == ieee:
+            # The device's own view of its neighbors
+            candidates.extend(
+                (neighbor.ieee, neighbor.lqi, neighbor.is_parent)
+                for neighbor in neighbors
+                if neighbor.is_router and not neighbor.is_child
+            )
+            continue
+        candidates.extend(
+            (router_ieee, neighbor.lqi, neighbor.is_child)
+            for neighbor in neighbors
+            if neighbor.ieee == ieee
+        )
+
+    if not candidates:
+        return None, None
+    parent_ieee, lqi, _is_parent = max(
+        candidates, key=lambda candidate: (candidate[2], candidate[1])
+    )
+    return parent_ieee, lqi
+
+
+@callback
+def async_get_parent_ieee(hass: HomeAssistant, ieee: str) -> str | None:
+    """Return the router carrying a device's route in the last topology scan."""
+    parent_ieee, _lqi = select_parent(ieee, async_get_topology_tables(hass))
+    return parent_ieee
+
+
+@callback
+def async_get_zha_entity_id(
+    hass: HomeAssistant, device_id: str, domain: str
+) -> str | None:
+    """Return the first ZHA entity of a domain belonging to a device."""
+    entity_registry = er.async_get(hass)
+    for entity in er.async_entries_for_device(entity_registry, device_id):
+        if entity.domain == domain and entity.platform == ZHA_DOMAIN:
+            return entity.entity_id
+    return None
+
+
+def get_device_ieee(device: dr.DeviceEntry) -> str | None:
+    """Return the IEEE address ZHA uses to identify a device."""
+    for domain, identifier in device.identifiers:
+        if domain == ZHA_DOMAIN:
+            return identifier
+    return None
+
+
+def get_ota_identity(zigpy_device: Any) -> tuple[int | None, int | None, int | None]:
+    """Return manufacturer code, OTA image type and current file version."""
+    manufacturer_code = getattr(zigpy_device, "manufacturer_id", None)
+    image_type = None
+    file_version = None
+
+    for endpoint_id, endpoint in zigpy_device.endpoints.items():
+        if endpoint_id == 0:
+            # ZDO endpoint
+            continue
+        cluster = endpoint.out_clusters.get(CLUSTER_OTA)
+        if cluster is None:
+            continue
+        image_type = cluster.get(ATTR_OTA_IMAGE_TYPE_ID)
+        file_version = cluster.get(ATTR_OTA_CURRENT_FILE_VERSION)
+        break
+
+    return manufacturer_code, image_type, file_version
+
+
+def format_file_version(file_version: int | None) -> str | None:
+    """Format an OTA file version the same way ZHA reports sw_version."""
+    if file_version is None:
+        return None
+    return f"0x{file_version:08x}"
+
+
+def parse_file_version(version: str | None) -> int | None:
+    """Parse an OTA file version as reported in sw_version."""
+    if not version:
+        return None
+    try:
+        return int(version, 16) if version.lower().startswith("0x") else int(version)
+    except ValueError:
+        return None